@@ -9,8 +9,26 @@ The hybrid approach achieves 100% accuracy for Tier 1 detection while being
 2.2x faster than the original implementation (1 API call vs 40+).
 """
 
-from .hybrid_iab_classifier import HybridIABClassifier
-from .optimized_tier1_detector import OptimizedTier1Detector
+import importlib
 
 __version__ = "1.0.0"
 __all__ = ["HybridIABClassifier", "OptimizedTier1Detector"]
+
+# Public name -> defining submodule. Imported on first access so that the CLI
+# entry point (and --help) does not load numpy and openai up front.
+_LAZY_EXPORTS = {
+    "HybridIABClassifier": ".hybrid_iab_classifier",
+    "OptimizedTier1Detector": ".optimized_tier1_detector",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,168 @@
+"""Persistent caches for expensive API results."""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from ._config import config
+
+logger = logging.getLogger(__name__)
+
+
+def content_key(*parts: str) -> str:
+    """Build a stable cache key from text parts (e.g. model name and content)."""
+    # Keys only need to be collision-resistant, and BLAKE2b is faster than SHA-256
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """
+    SQLite-backed key/value store with a small in-process LRU in front.
+
+    Cache failures (read-only home directory, locked database, ...) are logged
+    and treated as misses so they never break classification. With
+    ttl_seconds set, entries older than that are treated as misses too.
+    """
+
+    def __init__(self, name: str, directory: Optional[Path] = None, memory_entries: int = 1024,
+                 ttl_seconds: Optional[float] = None):
+        self.path = (directory or config.config_dir) / f"{name}.sqlite"
+        self.memory_entries = memory_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> (value, created_at)
+        self._memory: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use."""
+        if self._conn is None and not self._disabled:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cache ("
+                    "key TEXT PRIMARY KEY, value BLOB NOT NULL, created_at REAL NOT NULL DEFAULT 0)"
+                )
+                columns = {row[1] for row in self._conn.execute("PRAGMA table_info(cache)")}
+                if "created_at" not in columns:
+                    # Cache files written before TTL support
+                    self._conn.execute("ALTER TABLE cache ADD COLUMN created_at REAL NOT NULL DEFAULT 0")
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Disabling cache {self.path}: {e}")
+                self._disabled = True
+                self._conn = None
+        return self._conn
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds
+
+    def _remember(self, key: str, value: bytes, created_at: float) -> None:
+        self._memory[key] = (value, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached value for key, or None on a miss."""
+        with self._lock:
+            if key in self._memory:
+                value, created_at = self._memory[key]
+                if not self._expired(created_at):
+                    self._memory.move_to_end(key)
+                    return value
+                del self._memory[key]
+
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT value, created_at FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Cache read failed for {self.path}: {e}")
+                return None
+            if row is None or self._expired(row[1]):
+                return None
+
+            value = bytes(row[0])
+            self._remember(key, value, row[1])
+            return value
+
+    def put(self, key: str, value: bytes) -> None:
+        """Store value under key."""
+        created_at = time.time()
+        with self._lock:
+            self._remember(key, value, created_at)
+
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO cache (key, value, created_at) VALUES (?, ?, ?)",
+                        (key, sqlite3.Binary(value), created_at)
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"Cache write failed for {self.path}: {e}")
+
+
+class SemanticCache:
+    """
+    In-memory nearest-neighbour cache keyed by normalized embeddings.
+
+    A lookup hits when a stored embedding in the same scope has cosine
+    similarity >= threshold with the query. Oldest entries are evicted first.
+    """
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 1024):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._vectors: Optional[np.ndarray] = None
+        self._scopes: List[Hashable] = []
+        self._values: List[Any] = []
+        self._lock = threading.Lock()
+
+    def get(self, embedding: np.ndarray, scope: Hashable = None) -> Optional[Any]:
+        """Return the value stored for the closest matching embedding, or None."""
+        with self._lock:
+            if self._vectors is None:
+                return None
+            scores = self._vectors @ embedding
+            for i in np.argsort(-scores):
+                if scores[i] < self.threshold:
+                    break
+                if self._scopes[i] == scope:
+                    return self._values[i]
+            return None
+
+    def put(self, embedding: np.ndarray, value: Any, scope: Hashable = None) -> None:
+        """Store value under embedding, evicting the oldest entry when full."""
+        row = np.asarray(embedding, dtype=np.float32)[None, :]
+        with self._lock:
+            overflow = len(self._values) - (self.max_entries - 1)
+            if overflow > 0:
+                self._vectors = self._vectors[overflow:]
+                del self._scopes[:overflow]
+                del self._values[:overflow]
+
+            if self._vectors is None or not len(self._vectors):
+                self._vectors = row
+            else:
+                self._vectors = np.vstack((self._vectors, row))
+            self._scopes.append(scope)
+            self._values.append(value)
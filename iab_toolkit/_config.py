@@ -1,11 +1,20 @@
 """Configuration management for IAB toolkit."""
 
+import functools
 import os
-import json
 from pathlib import Path
 from typing import Optional, Dict, Any
 from dotenv import load_dotenv, set_key, find_dotenv
 
+from ._json import dumps_pretty, loads
+
+
+@functools.lru_cache(maxsize=None)
+def _load_env_once(env_file: str) -> None:
+    """Load environment variables from both system and local .env, once."""
+    load_dotenv()  # Load system .env first
+    load_dotenv(env_file)  # Then load user-specific .env
+
 
 class Config:
     """Configuration manager for IAB toolkit."""
@@ -14,24 +23,23 @@ class Config:
         self.config_dir = Path.home() / '.iab_toolkit'
         self.config_file = self.config_dir / 'config.json'
         self.env_file = self.config_dir / '.env'
-        
-        # Ensure config directory exists
-        self.config_dir.mkdir(exist_ok=True)
-        
-        # Create .env file if it doesn't exist
+        # Nothing is touched on disk here: the directory is created on first
+        # write and the .env files are parsed on first key lookup.
+    
+    def _ensure_config_dir(self) -> None:
+        """Create the config directory and user .env file if missing."""
+        self.config_dir.mkdir(parents=True, exist_ok=True)
         if not self.env_file.exists():
             self.env_file.touch()
-        
-        # Load environment variables from both system and local .env
-        load_dotenv()  # Load system .env first
-        load_dotenv(self.env_file)  # Then load user-specific .env
     
     def get_openai_api_key(self) -> Optional[str]:
         """Get OpenAI API key from environment."""
+        _load_env_once(str(self.env_file))
         return os.getenv('OPENAI_API_KEY')
     
     def set_openai_api_key(self, api_key: str) -> None:
         """Set OpenAI API key in user .env file."""
+        self._ensure_config_dir()
         set_key(str(self.env_file), 'OPENAI_API_KEY', api_key)
         os.environ['OPENAI_API_KEY'] = api_key
     
@@ -45,13 +53,12 @@ class Config:
                 'output_format': 'text'
             }
         
-        with open(self.config_file, 'r') as f:
-            return json.load(f)
+        return loads(self.config_file.read_bytes())
     
     def set_config(self, config: Dict[str, Any]) -> None:
         """Save configuration to config file."""
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        self._ensure_config_dir()
+        self.config_file.write_bytes(dumps_pretty(config))
     
     def update_config(self, **kwargs) -> None:
         """Update specific configuration values."""
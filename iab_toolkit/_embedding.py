@@ -1,49 +1,41 @@
 """Vector utilities and lazy loading of taxonomy embeddings."""
 
+import asyncio
+import base64
+import functools
 import json
-import os
 import numpy as np
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
 from pathlib import Path
 import logging
 
-import openai
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from ._cache import DiskCache, content_key
+from ._gpt import _get_client
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Content-hash -> float32 vector cache shared by all embed_* helpers
+_EMBEDDING_CACHE = DiskCache('embeddings')
+
+_DATA_DIR = Path(__file__).parent / 'data'
+
 
 class TaxonomyIndex:
-    """Singleton class for lazy-loading and caching taxonomy vectors."""
-    
-    _instance: Optional['TaxonomyIndex'] = None
-    _initialized = False
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    """Taxonomy data and vectors; use get_taxonomy_index() for the shared, loaded instance."""
     
     def __init__(self):
-        if not self._initialized:
-            self.taxonomy_data = None
-            self.taxonomy_vectors = None
-            self._initialized = True
+        self.taxonomy_data = None
+        self.taxonomy_vectors = None
     
     def load_index(self):
         """Load taxonomy data and vectors if not already loaded."""
         if self.taxonomy_data is not None and self.taxonomy_vectors is not None:
             return
         
-        # Get the path to the data directory
-        package_dir = Path(__file__).parent
-        data_dir = package_dir / 'data'
-        
-        taxonomy_path = data_dir / 'taxonomy.json'
-        vectors_path = data_dir / 'taxonomy_vec.npy'
+        taxonomy_path = _DATA_DIR / 'taxonomy.json'
+        vectors_path = _DATA_DIR / 'taxonomy_vec.npy'
         
         if not taxonomy_path.exists():
             raise FileNotFoundError(
@@ -61,23 +53,44 @@ class TaxonomyIndex:
         with open(taxonomy_path, 'r', encoding='utf-8') as f:
             self.taxonomy_data = json.load(f)
         
-        # Load vectors
-        self.taxonomy_vectors = np.load(vectors_path).astype(np.float32)
+        # Normalize once at load so similarity search is a single matvec
+        self.taxonomy_vectors = normalize_taxonomy_vectors(vectors_path)
         
         logger.info(f"Loaded {len(self.taxonomy_data)} taxonomy categories with vectors")
 
 
+def normalize_taxonomy_vectors(vectors_path: Path) -> np.ndarray:
+    """
+    Load raw taxonomy vectors and normalize their rows to unit length.
+    
+    Returns:
+        The normalized, C-contiguous float32 matrix
+    """
+    vectors = np.ascontiguousarray(np.load(vectors_path), dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    vectors /= norms
+    return vectors
+
+
+@functools.lru_cache(maxsize=1)
 def get_taxonomy_index() -> TaxonomyIndex:
-    """Get the singleton taxonomy index instance."""
-    return TaxonomyIndex()
+    """Get the shared taxonomy index, loading it on first use."""
+    index = TaxonomyIndex()
+    index.load_index()
+    return index
 
 
 def normalize_vector(vector: np.ndarray) -> np.ndarray:
-    """Normalize a vector to unit length."""
-    norm = np.linalg.norm(vector)
-    if norm == 0:
-        return vector
-    return vector / norm
+    """
+    Normalize a vector to unit length.
+    
+    A 2-D array is normalized row by row in one vectorized pass; zero rows
+    are left unchanged.
+    """
+    norms = np.linalg.norm(vector, axis=-1, keepdims=True)
+    norms[norms == 0] = 1
+    return vector / norms
 
 
 def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
@@ -85,60 +98,163 @@ def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
     return float(np.dot(a, b))
 
 
-async def embed_text(text: str) -> np.ndarray:
+def _embedding_key(text: str) -> str:
+    return content_key(EMBEDDING_MODEL, text)
+
+
+def _cached_embedding(key: str) -> Optional[np.ndarray]:
+    """Return a cached embedding vector, or None on a miss."""
+    raw = _EMBEDDING_CACHE.get(key)
+    if raw is None:
+        return None
+    return np.frombuffer(raw, dtype=np.float32).copy()
+
+
+def _cache_embedding(key: str, embedding: np.ndarray) -> None:
+    _EMBEDDING_CACHE.put(key, np.asarray(embedding, dtype=np.float32).tobytes())
+
+
+async def embed_text(text: str, use_cache: bool = True) -> np.ndarray:
     """
     Create embedding for text using OpenAI API.
     
+    Results are cached on disk by content hash, so repeated texts skip the API.
+    
     Args:
         text: Text to embed
+        use_cache: Read earlier embeddings from the cache (False always calls the API)
         
     Returns:
         Normalized embedding vector
     """
-    api_key = os.getenv('OPENAI_API_KEY')
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY environment variable not set")
-    
-    client = openai.OpenAI(api_key=api_key)
-    
-    try:
-        response = client.embeddings.create(
-            model="text-embedding-3-small",
-            input=text
-        )
-        embedding = np.array(response.data[0].embedding, dtype=np.float32)
-        return normalize_vector(embedding)
-    except Exception as e:
-        logger.error(f"Error creating embedding: {e}")
-        raise
-
-
-def embed_text_sync(text: str) -> np.ndarray:
+    return (await embed_texts([text], use_cache=use_cache))[0]
+
+
+def embed_text_sync(text: str, use_cache: bool = True) -> np.ndarray:
     """
     Synchronous version of embed_text.
     
     Args:
         text: Text to embed
+        use_cache: Read earlier embeddings from the cache (False always calls the API)
         
     Returns:
         Normalized embedding vector
     """
-    api_key = os.getenv('OPENAI_API_KEY')
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY environment variable not set")
+    return embed_texts_sync([text], use_cache=use_cache)[0]
+
+
+async def embed_texts(texts: List[str], batch_size: int = 64, use_cache: bool = True) -> np.ndarray:
+    """
+    Create embeddings for many texts, sending up to batch_size inputs per request.
     
-    client = openai.OpenAI(api_key=api_key)
+    Only texts missing from the embedding cache are sent to the API.
     
-    try:
-        response = client.embeddings.create(
-            model="text-embedding-3-small",
-            input=text
-        )
-        embedding = np.array(response.data[0].embedding, dtype=np.float32)
-        return normalize_vector(embedding)
-    except Exception as e:
-        logger.error(f"Error creating embedding: {e}")
-        raise
+    Args:
+        texts: Texts to embed
+        batch_size: Maximum number of inputs per embeddings request
+        use_cache: Read earlier embeddings from the cache; with False every
+            text is sent to the API (fresh results still refresh the cache)
+        
+    Returns:
+        Matrix of normalized embeddings, one row per input text
+    """
+    keys, vectors, missing = _split_cached(texts, use_cache)
+    if missing:
+        client = _get_client(async_=True)
+        pending = [texts[i] for i in missing]
+        
+        try:
+            responses = await asyncio.gather(*[
+                client.embeddings.create(
+                    model=EMBEDDING_MODEL,
+                    input=pending[start:start + batch_size],
+                    encoding_format="base64"
+                )
+                for start in range(0, len(pending), batch_size)
+            ])
+        except Exception as e:
+            logger.error(f"Error creating embeddings: {e}")
+            raise
+        
+        _fill_missing(keys, vectors, missing, _stack_embeddings(responses))
+    return _stack_vectors(vectors)
+
+
+def embed_texts_sync(texts: List[str], batch_size: int = 64, use_cache: bool = True) -> np.ndarray:
+    """
+    Synchronous version of embed_texts.
+    
+    Args:
+        texts: Texts to embed
+        batch_size: Maximum number of inputs per embeddings request
+        use_cache: Read earlier embeddings from the cache; with False every
+            text is sent to the API (fresh results still refresh the cache)
+        
+    Returns:
+        Matrix of normalized embeddings, one row per input text
+    """
+    keys, vectors, missing = _split_cached(texts, use_cache)
+    if missing:
+        client = _get_client()
+        pending = [texts[i] for i in missing]
+        
+        try:
+            responses = [
+                client.embeddings.create(
+                    model=EMBEDDING_MODEL,
+                    input=pending[start:start + batch_size],
+                    encoding_format="base64"
+                )
+                for start in range(0, len(pending), batch_size)
+            ]
+        except Exception as e:
+            logger.error(f"Error creating embeddings: {e}")
+            raise
+        
+        _fill_missing(keys, vectors, missing, _stack_embeddings(responses))
+    return _stack_vectors(vectors)
+
+
+def _split_cached(texts: List[str], use_cache: bool = True
+                  ) -> Tuple[List[str], List[Optional[np.ndarray]], List[int]]:
+    """Look texts up in the embedding cache; return keys, vectors and the indices of misses."""
+    keys = [_embedding_key(text) for text in texts]
+    if use_cache:
+        vectors = [_cached_embedding(key) for key in keys]
+    else:
+        vectors = [None] * len(keys)
+    missing = [i for i, vector in enumerate(vectors) if vector is None]
+    return keys, vectors, missing
+
+
+def _fill_missing(keys: List[str], vectors: List[Optional[np.ndarray]],
+                  missing: List[int], fetched: np.ndarray) -> None:
+    """Slot freshly fetched embeddings into place and cache them."""
+    for i, embedding in zip(missing, fetched):
+        vectors[i] = embedding
+        _cache_embedding(keys[i], embedding)
+
+
+def _stack_vectors(vectors: List[Optional[np.ndarray]]) -> np.ndarray:
+    if not vectors:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.vstack(vectors)
+
+
+def _embedding_row(embedding: Union[str, List[float]]) -> np.ndarray:
+    """Decode one embedding, base64 little-endian float32 or a plain float list."""
+    if isinstance(embedding, str):
+        return np.frombuffer(base64.b64decode(embedding), dtype='<f4')
+    return np.asarray(embedding, dtype=np.float32)
+
+
+def _stack_embeddings(responses) -> np.ndarray:
+    """Stack embedding responses (in request order) into a normalized matrix."""
+    rows = [_embedding_row(item.embedding) for response in responses for item in response.data]
+    if not rows:
+        return np.empty((0, 0), dtype=np.float32)
+    return normalize_vector(np.vstack(rows).astype(np.float32, copy=False))
 
 
 def find_similar_categories(
@@ -158,19 +274,18 @@ def find_similar_categories(
         List of (category_data, score) tuples sorted by score descending
     """
     index = get_taxonomy_index()
-    index.load_index()
     
-    # Compute similarities
-    similarities = []
     if not index.taxonomy_data or index.taxonomy_vectors is None:
         logger.error("Taxonomy data or vectors are not loaded.")
         return []
-    for i, category in enumerate(index.taxonomy_data):
-        category_vector = normalize_vector(index.taxonomy_vectors[i])
-        score = cosine_similarity(text_embedding, category_vector)
-        if score >= min_score:
-            similarities.append((category, score))
     
-    # Sort by score descending and limit
-    similarities.sort(key=lambda x: x[1], reverse=True)
-    return similarities[:max_categories]
+    # Compute all similarities at once (rows are pre-normalized)
+    scores = index.taxonomy_vectors @ text_embedding
+    candidates = np.flatnonzero(scores >= min_score)
+    if len(candidates) > max_categories:
+        top = np.argpartition(-scores[candidates], max_categories)[:max_categories]
+        candidates = candidates[top]
+    
+    # Sort the small candidate set by score descending
+    candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+    return [(index.taxonomy_data[i], float(scores[i])) for i in candidates]
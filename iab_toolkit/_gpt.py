@@ -25,59 +25,84 @@ Highlights
 
 from __future__ import annotations
 
-import json
+import asyncio
+import atexit
+import functools
 import logging
 import os
-from pathlib import Path
-from typing import List, Optional, Dict, Any, Union, overload
+import threading
+import weakref
+from importlib import resources
+from typing import List, Optional, Dict, Any, Tuple, Union, overload
 from typing_extensions import Literal
 
 import openai
-from dotenv import load_dotenv
 
+from ._config import config
+from ._json import loads
 from .models import CategoryResult, PersonaResult
 
+try:
+    import h2  # noqa: F401  (lets httpx negotiate HTTP/2)
+    HTTP2_AVAILABLE = hasattr(openai, "DefaultHttpxClient")
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # ---------------------------------------------------------------------------
 # Environment
 # ---------------------------------------------------------------------------
-load_dotenv()
+# .env files are loaded lazily by config on the first API key lookup
 logger = logging.getLogger(__name__)
 
 # You can override via env, but default to the latest small GPT family.
 MODEL_NAME: str = os.getenv("OPENAI_MODEL_NAME", "gpt-4.1-nano")
 
+# Attempts the SDK makes on 429s, timeouts, connection errors and 5xx answers,
+# with exponential backoff and jitter between them. OPENAI_MAX_RETRIES is read
+# when a client is created, after config has loaded the .env files.
+DEFAULT_MAX_RETRIES: int = 4
+
 # Load taxonomy data
 _TAXONOMY_DATA: Optional[List[Dict[str, Any]]] = None
+# Lowercase name -> first taxonomy entry with that name
+_NAME_INDEX: Dict[str, Dict[str, Any]] = {}
+# (lowercase name, entry) pairs in taxonomy order, for substring matching
+_LOWER_NAMES: List[Tuple[str, Dict[str, Any]]] = []
 
 def _load_taxonomy() -> List[Dict[str, Any]]:
     """Load the taxonomy data once and cache it."""
-    global _TAXONOMY_DATA
+    global _TAXONOMY_DATA, _NAME_INDEX, _LOWER_NAMES
     if _TAXONOMY_DATA is None:
         try:
-            taxonomy_path = Path(__file__).parent / "data" / "taxonomy.json"
-            with open(taxonomy_path, 'r', encoding='utf-8') as f:
-                _TAXONOMY_DATA = json.load(f)
+            raw = resources.files(__package__).joinpath("data/taxonomy.json").read_bytes()
+            _TAXONOMY_DATA = loads(raw)
             # Remove the header row if it exists
             if _TAXONOMY_DATA and _TAXONOMY_DATA[0].get("unique_id") == "Unique ID":
                 _TAXONOMY_DATA = _TAXONOMY_DATA[1:]
         except Exception as e:
             logger.error(f"Failed to load taxonomy data: {e}")
             _TAXONOMY_DATA = []
+        
+        _LOWER_NAMES = [(entry["name"].lower(), entry) for entry in _TAXONOMY_DATA]
+        _NAME_INDEX = {}
+        for name_lower, entry in _LOWER_NAMES:
+            _NAME_INDEX.setdefault(name_lower, entry)
     return _TAXONOMY_DATA or []
 
+@functools.lru_cache(maxsize=4096)
 def _find_taxonomy_entry(category_name: str) -> Optional[Dict[str, Any]]:
     """Find a taxonomy entry by category name (case-insensitive partial match)."""
-    taxonomy = _load_taxonomy()
+    _load_taxonomy()
     category_lower = category_name.lower()
     
     # First try exact match
-    for entry in taxonomy:
-        if entry["name"].lower() == category_lower:
-            return entry
+    entry = _NAME_INDEX.get(category_lower)
+    if entry is not None:
+        return entry
     
     # Then try partial match
-    for entry in taxonomy:
-        if category_lower in entry["name"].lower():
+    for name_lower, entry in _LOWER_NAMES:
+        if category_lower in name_lower:
             return entry
     
     return None
@@ -86,6 +111,24 @@ def _find_taxonomy_entry(category_name: str) -> Optional[Dict[str, Any]]:
 # Client helpers
 # ---------------------------------------------------------------------------
 
+# One pooled client per API key, reused by every call so TCP/TLS connections
+# stay alive between requests. With h2 installed the pool speaks HTTP/2, so
+# concurrent requests multiplex over a single connection.
+_SYNC_CLIENTS: Dict[str, openai.OpenAI] = {}
+# Async clients hold connections bound to the event loop that opened them, so
+# they are cached per running loop and dropped together with the loop.
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, openai.AsyncOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+_CLIENT_LOCK = threading.Lock()
+
+def _http_client_options(async_: bool) -> Dict[str, Any]:
+    """Extra client kwargs enabling HTTP/2 when the h2 package is installed."""
+    if not HTTP2_AVAILABLE:
+        return {}
+    factory = openai.DefaultAsyncHttpxClient if async_ else openai.DefaultHttpxClient
+    return {"http_client": factory(http2=True)}
+
 @overload
 def _get_client(async_: Literal[False] = False) -> openai.OpenAI: ...
 
@@ -93,11 +136,44 @@ def _get_client(async_: Literal[False] = False) -> openai.OpenAI: ...
 def _get_client(async_: Literal[True]) -> openai.AsyncOpenAI: ...
 
 def _get_client(async_: bool = False) -> Union[openai.OpenAI, openai.AsyncOpenAI]:
-    """Return a configured OpenAI client (sync or async)."""
-    api_key = os.getenv("OPENAI_API_KEY")
+    """
+    Return the shared OpenAI client for the current API key.
+    
+    Async clients are shared per event loop; outside a running loop a fresh,
+    uncached client is returned.
+    """
+    api_key = config.get_openai_api_key()
     if not api_key:
         raise ValueError("OPENAI_API_KEY environment variable not set")
-    return (openai.AsyncOpenAI if async_ else openai.OpenAI)(api_key=api_key)
+    max_retries = int(os.getenv("OPENAI_MAX_RETRIES", DEFAULT_MAX_RETRIES))
+    
+    if async_:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return openai.AsyncOpenAI(api_key=api_key, max_retries=max_retries, **_http_client_options(True))
+        
+        with _CLIENT_LOCK:
+            clients = _ASYNC_CLIENTS.setdefault(loop, {})
+            client = clients.get(api_key)
+            if client is None:
+                client = openai.AsyncOpenAI(api_key=api_key, max_retries=max_retries, **_http_client_options(True))
+                clients[api_key] = client
+            return client
+    
+    with _CLIENT_LOCK:
+        client = _SYNC_CLIENTS.get(api_key)
+        if client is None:
+            client = openai.OpenAI(api_key=api_key, max_retries=max_retries, **_http_client_options(False))
+            _SYNC_CLIENTS[api_key] = client
+        return client
+
+
+@atexit.register
+def _close_clients() -> None:
+    """Close pooled sync connections at interpreter exit."""
+    for client in _SYNC_CLIENTS.values():
+        client.close()
 
 
 # ---------------------------------------------------------------------------
@@ -105,11 +181,33 @@ def _get_client(async_: bool = False) -> Union[openai.OpenAI, openai.AsyncOpenAI
 # ---------------------------------------------------------------------------
 
 def _clean_json_response(text: str) -> str:
-    """Strip Markdown code fences from a JSON answer, if present."""
-    text = text.strip()
-    if text.startswith("```"):
-        lines = text.split("\n")
-        text = "\n".join(lines[1:-1])
+    """
+    Strip Markdown code fences or surrounding prose from a JSON answer, if present.
+    
+    Returns the text unchanged when no JSON value can be cut out of it.
+    """
+    text = text.lstrip()
+    # Common case: a bare JSON object, returned without extra copies
+    if text[:1] == "{":
+        return text
+    # Otherwise try the first '{' and the first '[' in order of appearance,
+    # each sliced to its last matching closing bracket, and keep the first
+    # slice that parses: a fenced array of objects starts at its '[', while
+    # bracketed prose ("[Note] {...}") falls through to the object
+    starts = sorted(
+        (start, closing)
+        for opening, closing in (("{", "}"), ("[", "]"))
+        if (start := text.find(opening)) != -1
+    )
+    for start, closing in starts:
+        end = text.rfind(closing)
+        if end > start:
+            candidate = text[start:end + 1]
+            try:
+                loads(candidate)
+            except ValueError:
+                continue
+            return candidate
     return text
 
 
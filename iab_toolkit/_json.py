@@ -0,0 +1,39 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import dataclasses
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj: Any) -> Any:
+    """Serialize dataclass instances for stdlib json (orjson does this natively)."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj (dataclasses included) as compact UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_default).encode('utf-8')
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Serialize obj (dataclasses included) as 2-space indented UTF-8 JSON, keeping non-ASCII text as-is."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_default).encode('utf-8')
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON from str or bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -4,9 +4,9 @@ Simple CLI for IAB Hybrid Classifier
 """
 
 import argparse
+import logging
 import sys
 from pathlib import Path
-from .hybrid_iab_classifier import HybridIABClassifier
 
 
 def main():
@@ -47,6 +47,11 @@ Examples:
         action="store_true",
         help="Output results in JSON format"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached results and call the APIs again (--test never uses them)"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -55,15 +60,20 @@ Examples:
     
     args = parser.parse_args()
     
+    # Classifier progress is logged to stderr, so --json output stays clean
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(message)s")
+    
     # Handle test mode
     if args.test:
         from .test_japanese_samples import main as test_main
-        return test_main()
+        # Timings are only meaningful against the live APIs
+        return test_main(use_cache=False)
     
     # Handle client report mode
     if args.client_report:
         from .test_japanese_samples_client_report import main as client_main
-        return client_main()
+        return client_main(use_cache=not args.no_cache)
     
     # Get text content
     text_content = None
@@ -92,7 +102,9 @@ Examples:
         if args.verbose:
             print("Initializing HybridIABClassifier...")
         
-        classifier = HybridIABClassifier()
+        # Imported here so --help and argument errors skip loading numpy/openai
+        from .hybrid_iab_classifier import HybridIABClassifier
+        classifier = HybridIABClassifier(use_cache=not args.no_cache)
         
         # Classify content
         if args.verbose:
@@ -102,10 +114,10 @@ Examples:
         
         # Output results
         if args.json:
-            import json
-            from dataclasses import asdict
-            result_dict = asdict(result)
-            print(json.dumps(result_dict, indent=2, ensure_ascii=False))
+            from ._json import dumps_pretty
+            sys.stdout.flush()
+            sys.stdout.buffer.write(dumps_pretty(result) + b"\n")
+            sys.stdout.buffer.flush()
         else:
             print_readable_results(result, text_content)
         
@@ -122,42 +134,47 @@ Examples:
 
 def print_readable_results(result, text_content):
     """Print results in human-readable format."""
-    print("\n" + "="*60)
-    print("IAB HYBRID CLASSIFICATION RESULTS")
-    print("="*60)
+    # Collect the report and write it once instead of one print per line
+    lines = []
+    add = lines.append
+    
+    add("\n" + "="*60)
+    add("IAB HYBRID CLASSIFICATION RESULTS")
+    add("="*60)
     
     # Text preview
     preview = text_content[:100] + "..." if len(text_content) > 100 else text_content
-    print(f"📖 Text Preview: {preview}")
-    print(f"📏 Text Length: {len(text_content)} characters")
-    print()
+    add(f"📖 Text Preview: {preview}")
+    add(f"📏 Text Length: {len(text_content)} characters")
+    add("")
     
     # Tier 1 Domain
-    print(f"🎯 Primary Domain: {result.primary_tier1_domain}")
+    add(f"🎯 Primary Domain: {result.primary_tier1_domain}")
     
     # Tier 2 Categories
     if result.tier2_categories:
-        print(f"\n🏷️  Top Tier 2 Categories:")
+        add(f"\n🏷️  Top Tier 2 Categories:")
         for i, cat in enumerate(result.tier2_categories, 1):
             confidence = cat.get('confidence', 0) * 100
             iab_id = cat.get('id', 'N/A')
-            print(f"   {i}. {cat['name']} (IAB: {iab_id}) ({confidence:.1f}%)")
+            add(f"   {i}. {cat['name']} (IAB: {iab_id}) ({confidence:.1f}%)")
     
     # User Profile
     if result.user_profile:
         profile = result.user_profile
-        print(f"\n👤 User Profile:")
-        print(f"   Age Range: {profile.age_range}")
-        print(f"   Gender: {profile.gender}")
-        print(f"   Geek Level: {profile.geek_level}/10")
-        print(f"   Media Quality: {profile.media_quality}")
-        print(f"   Demographics: {profile.likely_demographics}")
+        add(f"\n👤 User Profile:")
+        add(f"   Age Range: {profile.age_range}")
+        add(f"   Gender: {profile.gender}")
+        add(f"   Geek Level: {profile.geek_level}/10")
+        add(f"   Media Quality: {profile.media_quality}")
+        add(f"   Demographics: {profile.likely_demographics}")
     
     # Processing info
     if result.processing_time:
-        print(f"\n⏱️  Processing Time: {result.processing_time:.3f} seconds")
+        add(f"\n⏱️  Processing Time: {result.processing_time:.3f} seconds")
     
-    print("\n" + "="*60)
+    add("\n" + "="*60)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -16,34 +16,188 @@ Author: GitHub Copilot
 Date: May 24, 2025
 """
 
-import json
+import functools
+import logging
+import re
 import time
 import numpy as np
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 # Import the IAB toolkit components
 try:
-    from ._gpt import _get_client, _load_taxonomy
+    from ._gpt import _get_client, _load_taxonomy, _clean_json_response
     from .models import CategoryResult
-    from ._embedding import embed_text_sync, normalize_vector, cosine_similarity
+    from ._embedding import embed_text_sync, embed_texts_sync, normalize_vector, cosine_similarity
     from ._config import config
+    from ._cache import DiskCache, SemanticCache, content_key
     REAL_API_AVAILABLE = True
 except ImportError as e:
-    print(f"Warning: IAB toolkit not fully available: {e}")
+    logger.warning(f"IAB toolkit not fully available: {e}")
     REAL_API_AVAILABLE = False
 
+from ._json import dumps, dumps_pretty, loads
+
 # Import the optimized tier 1 detector
 try:
-    from .optimized_tier1_detector import OptimizedTier1Detector
+    from .optimized_tier1_detector import get_detector
     OPTIMIZED_DETECTOR_AVAILABLE = True
 except ImportError as e:
-    print(f"Warning: Optimized tier 1 detector not available: {e}")
+    logger.warning(f"Optimized tier 1 detector not available: {e}")
     OPTIMIZED_DETECTOR_AVAILABLE = False
 
-@dataclass
+# Static instructions come first so every Tier 2 request shares the same
+# prompt prefix, which lets OpenAI's automatic prompt caching reuse it; only
+# the per-domain category list at the end varies.
+_TIER2_SYSTEM_PROMPT = """You are an expert at classifying content into IAB taxonomy categories and analyzing user profiles.
+
+Instructions:
+1. Analyze the content and select the TOP 2 most relevant Tier 2 categories from the list below
+2. Provide confidence scores (0.0-1.0) for each category
+3. Analyze the user profile based on the content
+4. Estimate demographics and behavior patterns
+
+Response format (JSON):
+{{
+  "tier2_categories": [
+    {{
+      "id": "category_id",
+      "name": "category_name", 
+      "confidence": 0.95,
+      "reasoning": "why this category fits"
+    }}
+  ],
+  "user_profile": {{
+    "age_range": "30-45",
+    "gender": "neutral",
+    "geek_level": 7,
+    "media_quality": "advanced",
+    "likely_demographics": "tech-savvy professional",
+    "confidence": 0.8
+  }}
+}}
+
+Available Tier 2 categories in {tier1_domain} domain:
+{categories_text}"""
+
+_TIER2_USER_PROMPT_PREFIX = "Analyze and classify this content:\n\n"
+
+_TIER2_MODEL = "gpt-4.1-nano"
+
+# Domain keyword mapping for the keyword-based Tier 1 fallback
+_FALLBACK_DOMAIN_KEYWORDS = {
+    'Automotive': ['car', 'vehicle', 'toyota', 'honda', 'suv', 'sedan', 'auto', '車', 'ドライブ'],
+    'Technology & Computing': ['tech', 'computer', 'software', 'ai', 'digital', 'コンピューター'],
+    'Medical Health': ['health', 'medical', 'doctor', 'fitness', '健康', '医療'],
+    'Business and Finance': ['business', 'finance', 'money', 'investment', 'ビジネス', '投資', '企業', '株価', '売上', '成長', '決算', '収益', 'アナリスト', '機関投資家', 'ESG'],
+    'Education': ['education', 'school', 'learning', '教育', '学校'],
+    'Style & Fashion': ['fashion', 'beauty', 'makeup', 'style', 'ファッション']
+}
+_FALLBACK_KEYWORD_DOMAINS = {
+    keyword: domain
+    for domain, keywords in _FALLBACK_DOMAIN_KEYWORDS.items()
+    for keyword in keywords
+}
+# A zero-width lookahead reports overlapping occurrences too, so a single scan
+# matches what per-keyword substring checks would find (no keyword is a
+# prefix of another)
+_FALLBACK_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(map(re.escape, _FALLBACK_KEYWORD_DOMAINS)) + "))"
+)
+
+# LLM answers, and results built from them, are refreshed after 30 days;
+# embeddings are deterministic and never expire
+_LLM_CACHE_TTL = 30 * 24 * 3600
+
+# Bump when the pipeline changes in a way that invalidates cached results
+_RESULT_CACHE_VERSION = f"hybrid-v1:{_TIER2_MODEL}"
+
+def _read_json_object(stream) -> str:
+    """
+    Collect streamed completion text up to the end of its first JSON object.
+    
+    Nothing is tracked before the first '{' (the Tier 2 answer is always an
+    object, so brackets or quotes in leading prose are ignored). From there
+    brace depth is tracked outside string literals; once the object is
+    balanced the stream is closed, so trailing output the model may still be
+    generating is never waited for.
+    """
+    parts = []
+    depth = 0
+    in_string = escaped = False
+    try:
+        for chunk in stream:
+            if not chunk.choices or not chunk.choices[0].delta.content:
+                continue
+            delta = chunk.choices[0].delta.content
+            for i, ch in enumerate(delta):
+                if not depth:
+                    if ch == '{':
+                        depth = 1
+                elif in_string:
+                    if escaped:
+                        escaped = False
+                    elif ch == '\\':
+                        escaped = True
+                    elif ch == '"':
+                        in_string = False
+                elif ch == '"':
+                    in_string = True
+                elif ch in '{[':
+                    depth += 1
+                elif ch in '}]':
+                    depth -= 1
+                    if not depth:
+                        parts.append(delta[:i + 1])
+                        return "".join(parts)
+            parts.append(delta)
+    finally:
+        stream.close()
+    return "".join(parts)
+
+
+@functools.cache
+def _taxonomy_indexes() -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+    """
+    Index the shared taxonomy once per process.
+    
+    Returns:
+        (Tier 1 entries, Tier 1 domain -> its Tier 2 entries)
+    """
+    taxonomy = _load_taxonomy() if REAL_API_AVAILABLE else []
+    tier1_categories = []
+    tier2_by_tier1: Dict[str, List[Dict[str, Any]]] = {}
+    for entry in taxonomy:
+        if entry.get('tier_1') and not entry.get('tier_2'):  # Only Tier 1 entries
+            tier1_categories.append(entry)
+        if (entry.get('tier_1') is not None and
+            entry.get('tier_2') is not None and 
+            entry.get('tier_3') is None and 
+            entry.get('tier_4') is None):
+            tier2_by_tier1.setdefault(entry['tier_1'], []).append(entry)
+    return tier1_categories, tier2_by_tier1
+
+
+@functools.cache
+def _result_cache_version() -> str:
+    """
+    Version tag for cached classification results.
+    
+    Besides the model, it covers the Tier 2 prompt and the taxonomy, so
+    editing either invalidates results cached by earlier runs.
+    """
+    digest = content_key(_TIER2_SYSTEM_PROMPT, _TIER2_USER_PROMPT_PREFIX,
+                         dumps(_load_taxonomy()).decode('utf-8'))
+    return f"{_RESULT_CACHE_VERSION}:{digest}"
+
+
+@dataclass(slots=True)
 class UserProfile:
     """Enhanced user profile based on content analysis."""
     age_range: str  # "18-25", "26-35", "36-45", "46-55", "55+"
@@ -53,7 +207,7 @@ class UserProfile:
     likely_demographics: str
     confidence: float  # 0.0-1.0
 
-@dataclass
+@dataclass(slots=True)
 class FinalClassificationResult:
     """Final classification result with Tier 2 categories and user profile."""
     primary_tier1_domain: str
@@ -72,28 +226,41 @@ class HybridIABClassifier:
     - NEW: 1 API call per classification (~450ms)
     """
     
-    def __init__(self):
-        """Initialize the classifier with optimized tier 1 detection."""
+    def __init__(self, use_cache: bool = True):
+        """
+        Initialize the classifier with optimized tier 1 detection.
+        
+        Args:
+            use_cache: Reuse earlier classification, LLM and embedding results
+                stored in ~/.iab_toolkit (disable to force fresh API calls)
+        """
         self.taxonomy = _load_taxonomy() if REAL_API_AVAILABLE else []
-        self.tier1_categories = self._get_tier1_categories()
+        # Shared by every instance; the taxonomy is static
+        self.tier1_categories, self._tier2_by_tier1 = _taxonomy_indexes()
         
         # Initialize optimized tier 1 detector
         if OPTIMIZED_DETECTOR_AVAILABLE:
-            print("🚀 Initializing OptimizedTier1Detector for fast classification...")
-            self.optimized_tier1_detector = OptimizedTier1Detector()
-            print(f"✅ Loaded optimized embeddings for {len(self.optimized_tier1_detector.tier1_domains)} domains")
+            logger.info("Initializing OptimizedTier1Detector for fast classification...")
+            self.optimized_tier1_detector = get_detector()
+            logger.info(f"Loaded optimized embeddings for {len(self.optimized_tier1_detector.tier1_domains)} domains")
         else:
-            print("⚠️  OptimizedTier1Detector not available, using fallback approach")
+            logger.warning("OptimizedTier1Detector not available, using fallback approach")
             self.optimized_tier1_detector = None
         
-    def _get_tier1_categories(self) -> List[Dict[str, Any]]:
-        """Get all Tier 1 categories from taxonomy."""
-        tier1_categories = []
-        for entry in self.taxonomy:
-            if entry.get('tier_1') and not entry.get('tier_2'):  # Only Tier 1 entries
-                tier1_categories.append(entry)
-        return tier1_categories
-    
+        # With use_cache=False nothing is read from earlier runs, embeddings included
+        self.use_cache = use_cache
+        
+        # Reuse Tier 2 / profile answers for near-duplicate texts in the same domain
+        caching = REAL_API_AVAILABLE and use_cache
+        self._llm_cache = SemanticCache(threshold=0.95) if caching else None
+        self._llm_exact_cache = DiskCache('llm_results', ttl_seconds=_LLM_CACHE_TTL) if caching else None
+        # Whole classification results for texts seen in earlier runs
+        self._result_cache = DiskCache('classify_results', ttl_seconds=_LLM_CACHE_TTL) if caching else None
+        # Tier 1 domain -> prebuilt system message (the category list is fixed per domain)
+        self._system_messages: Dict[str, Dict[str, str]] = {}
+        # OpenAI client, resolved on the first Tier 2 request
+        self._client = None
+        
     def _embedding_tier1_detection(self, text: str) -> Tuple[str, float]:
         """
         OPTIMIZED: Use precomputed embeddings for ultra-fast Tier 1 detection.
@@ -106,35 +273,29 @@ class HybridIABClassifier:
         if self.optimized_tier1_detector:
             # Use the optimized detector (pure embedding-based, no keyword fallbacks)
             # The OptimizedTier1Detector itself handles the REAL_API_AVAILABLE check for embedding the input text.
-            domain, confidence = self.optimized_tier1_detector.detect_tier1_domain(text)
+            domain, confidence = self.optimized_tier1_detector.detect_tier1_domain(
+                text, use_cache=self.use_cache)
             if domain == "Unknown" and confidence == 0.0 and not REAL_API_AVAILABLE:
                 # This case means OptimizedTier1Detector couldn't embed the input text due to API unavailability.
-                print("⚠️ Optimized detector could not process text due to API unavailability, falling back to keyword-based Tier 1 detection.")
+                logger.warning("Optimized detector could not process text due to API unavailability, falling back to keyword-based Tier 1 detection.")
                 return self._fallback_tier1_detection(text)
             return domain, confidence
         
         # Fallback to keyword-based approach if OptimizedTier1Detector instance is not available
-        print("⚠️ OptimizedTier1Detector instance not available, falling back to keyword-based Tier 1 detection.")
+        logger.warning("OptimizedTier1Detector instance not available, falling back to keyword-based Tier 1 detection.")
         return self._fallback_tier1_detection(text)
     
     def _fallback_tier1_detection(self, text: str) -> Tuple[str, float]:
         """Fallback Tier 1 detection using keyword matching."""
-        text_lower = text.lower()
-        
-        # Domain keyword mapping
-        domain_keywords = {
-            'Automotive': ['car', 'vehicle', 'toyota', 'honda', 'suv', 'sedan', 'auto', '車', 'ドライブ'],
-            'Technology & Computing': ['tech', 'computer', 'software', 'ai', 'digital', 'コンピューター'],
-            'Medical Health': ['health', 'medical', 'doctor', 'fitness', '健康', '医療'],
-            'Business and Finance': ['business', 'finance', 'money', 'investment', 'ビジネス', '投資', '企業', '株価', '売上', '成長', '決算', '収益', 'アナリスト', '機関投資家', 'ESG'],
-            'Education': ['education', 'school', 'learning', '教育', '学校'],
-            'Style & Fashion': ['fashion', 'beauty', 'makeup', 'style', 'ファッション']        }
+        # One regex scan finds every keyword; each distinct keyword scores once
+        matched = set(_FALLBACK_KEYWORD_PATTERN.findall(text.lower()))
+        scores = Counter(_FALLBACK_KEYWORD_DOMAINS[keyword] for keyword in matched)
         
         best_domain = "Automotive"  # Default
         best_score = 0.0
         
-        for domain, keywords in domain_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
+        for domain in _FALLBACK_DOMAIN_KEYWORDS:
+            score = scores[domain]
             if score > best_score:
                 best_score = score
                 best_domain = domain
@@ -144,15 +305,27 @@ class HybridIABClassifier:
     
     def _get_tier2_categories_for_domain(self, tier1_domain: str) -> List[Dict[str, Any]]:
         """Get all Tier 2 categories for the specified Tier 1 domain."""
-        tier2_categories = []
-        
-        for entry in self.taxonomy:
-            if (entry.get('tier_1') == tier1_domain and 
-                entry.get('tier_2') is not None and 
-                entry.get('tier_3') is None and 
-                entry.get('tier_4') is None):
-                tier2_categories.append(entry)
-        return tier2_categories
+        return self._tier2_by_tier1.get(tier1_domain, [])
+    
+    def _tier2_system_message(self, tier1_domain: str,
+                              tier2_categories: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Build (once per domain) the system message listing the domain's Tier 2 categories."""
+        message = self._system_messages.get(tier1_domain)
+        if message is None:
+            # Format categories for LLM
+            categories_text = "\n".join([
+                f"{cat['unique_id']}: {cat['name']}"
+                for cat in tier2_categories
+            ])
+            message = {
+                "role": "system",
+                "content": _TIER2_SYSTEM_PROMPT.format(
+                    tier1_domain=tier1_domain,
+                    categories_text=categories_text
+                )
+            }
+            self._system_messages[tier1_domain] = message
+        return message
     
     def _llm_tier2_classification_with_profiling(self, text: str, tier1_domain: str, 
                                                tier2_categories: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -174,74 +347,39 @@ class HybridIABClassifier:
             }
         
         try:
-            # Format categories for LLM
-            categories_text = "\n".join([
-                f"{cat['unique_id']}: {cat['name']}"
-                for cat in tier2_categories
-            ])
+            system_message = self._tier2_system_message(tier1_domain, tier2_categories)
+            if self._client is None:
+                self._client = _get_client(async_=False)
+            client = self._client
             
-            system_prompt = f"""You are an expert at classifying content into IAB taxonomy categories and analyzing user profiles.
-
-Available Tier 2 categories in {tier1_domain} domain:
-{categories_text}
-
-Instructions:
-1. Analyze the content and select the TOP 2 most relevant Tier 2 categories from the list above
-2. Provide confidence scores (0.0-1.0) for each category
-3. Analyze the user profile based on the content
-4. Estimate demographics and behavior patterns
-
-Response format (JSON):
-{{
-  "tier2_categories": [
-    {{
-      "id": "category_id",
-      "name": "category_name", 
-      "confidence": 0.95,
-      "reasoning": "why this category fits"
-    }}
-  ],
-  "user_profile": {{
-    "age_range": "30-45",
-    "gender": "neutral",
-    "geek_level": 7,
-    "media_quality": "advanced",
-    "likely_demographics": "tech-savvy professional",
-    "confidence": 0.8
-  }}
-}}"""
-
-            client = _get_client(async_=False)
-            
-            response = client.chat.completions.create(
-                model="gpt-4.1-nano",
+            # Stream the answer so tokens are consumed as they are generated
+            stream = client.chat.completions.create(
+                model=_TIER2_MODEL,
                 messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": f"Analyze and classify this content:\n\n{text[:2000]}"}
+                    system_message,
+                    {"role": "user", "content": _TIER2_USER_PROMPT_PREFIX + text[:2000]}
                 ],
                 temperature=0.1,
-                max_completion_tokens=1000
+                # Two categories with short reasoning plus the profile fit well under this
+                max_completion_tokens=400,
+                # JSON mode guarantees a parseable object (no prose, no code fences)
+                response_format={"type": "json_object"},
+                stream=True
             )
             
-            # Ensure response is properly awaited if needed
-            if hasattr(response, '__await__'):
-                # This shouldn't happen with sync client, but just in case
-                raise RuntimeError("Unexpected async response from sync client")
-            
-            content = response.choices[0].message.content
+            content = _read_json_object(stream)
             if not content:
                 return {"error": "Empty response from GPT"}
             
-            # Clean and parse JSON response
-            clean_content = content.strip()
-            if clean_content.startswith("```"):
-                lines = clean_content.split("\n")
-                clean_content = "\n".join(lines[1:-1])
-            
-            return json.loads(clean_content)
+            # Clean and parse JSON response (fence stripping is a guard for
+            # models that ignore JSON mode)
+            parsed = loads(_clean_json_response(content))
+            if not isinstance(parsed, dict):
+                raise ValueError(f"Expected a JSON object, got {type(parsed).__name__}")
+            return parsed
             
         except Exception as e:
-            print(f"Error in LLM classification: {e}")
+            logger.error(f"Error in LLM classification: {e}")
             # Return basic fallback instead of mock function
             return {
                 "tier2_categories": [],
@@ -255,32 +393,105 @@ Response format (JSON):
                 }
             }
     
+    def _cached_llm_tier2_classification(self, text: str, tier1_domain: str,
+                                         tier2_categories: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Cache wrapper around _llm_tier2_classification_with_profiling.
+        
+        Identical texts are answered from a persistent content-hash cache
+        (~/.iab_toolkit/llm_results.sqlite) without embedding. Otherwise,
+        texts whose embedding is within cosine 0.95 of an already classified
+        text in the same Tier 1 domain reuse that LLM result.
+        """
+        exact_key = None
+        if self._llm_exact_cache is not None:
+            # Key on the exact prompt sent: the system message (instructions and
+            # the domain's category list) plus the first 2000 characters of text
+            system_prompt = self._tier2_system_message(tier1_domain, tier2_categories)["content"]
+            exact_key = content_key(_TIER2_MODEL, system_prompt,
+                                    _TIER2_USER_PROMPT_PREFIX, text[:2000])
+            cached = self._llm_exact_cache.get(exact_key)
+            if cached is not None:
+                logger.info("Reusing cached LLM result for an identical text")
+                return loads(cached)
+        
+        text_embedding = None
+        if self._llm_cache is not None and self.optimized_tier1_detector:
+            text_embedding = self.optimized_tier1_detector.embed_text(text)
+        
+        if text_embedding is not None:
+            cached = self._llm_cache.get(text_embedding, scope=tier1_domain)
+            if cached is not None:
+                logger.info("Reusing cached LLM result for a near-duplicate text")
+                return loads(cached)
+        
+        llm_result = self._llm_tier2_classification_with_profiling(text, tier1_domain, tier2_categories)
+        
+        # Only cache real answers, not the fallback returned on errors
+        # Both tiers store serialized bytes, so every hit decodes a fresh dict
+        # and callers never share (or mutate) the cached categories
+        if llm_result.get('tier2_categories'):
+            serialized = dumps(llm_result)
+            if exact_key is not None:
+                self._llm_exact_cache.put(exact_key, serialized)
+            if text_embedding is not None:
+                self._llm_cache.put(text_embedding, serialized, scope=tier1_domain)
+        return llm_result
+    
     def classify(self, text: str) -> FinalClassificationResult:
         """
         Main classification method that combines optimized Tier 1 detection
         with LLM-based Tier 2 classification and user profiling.
         
+        Results for texts classified before are returned from the on-disk
+        result cache without any API calls.
+        
         PERFORMANCE: ~2.2x faster than original with OptimizedTier1Detector!
         """
-        start_time = time.time()
+        return self._classify(text)
+    
+    def _classify(self, text: str, tier1: Optional[Tuple[str, float]] = None) -> FinalClassificationResult:
+        """classify() with an optional precomputed (tier1_domain, confidence)."""
+        if self._result_cache is None:
+            return self._classify_uncached(text, tier1)
+        
+        start_time = time.perf_counter()
+        cache_key = content_key(_result_cache_version(), text)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            data = loads(cached)
+            data['user_profile'] = UserProfile(**data['user_profile'])
+            data['processing_time'] = time.perf_counter() - start_time
+            logger.info("Returning cached classification result")
+            return FinalClassificationResult(**data)
         
-        print("=== OPTIMIZED HYBRID IAB CLASSIFICATION ===")
-        print("🚀 Using OptimizedTier1Detector for fast performance!")
+        result = self._classify_uncached(text, tier1)
+        # Fallback results (no categories) are retried on the next run
+        if result.tier2_categories:
+            self._result_cache.put(cache_key, dumps(result))
+        return result
+    
+    def _classify_uncached(self, text: str,
+                           tier1: Optional[Tuple[str, float]] = None) -> FinalClassificationResult:
+        """Run the full embedding + LLM classification pipeline."""
+        start_time = time.perf_counter()
         
         # Step 1: Optimized Tier 1 detection (1 API call vs 40+)
-        print("Step 1: Optimized Tier 1 domain detection...")
-        tier1_domain, tier1_confidence = self._embedding_tier1_detection(text)
-        print(f"Primary domain: {tier1_domain} (confidence: {tier1_confidence:.3f})")
+        logger.debug("Step 1: Optimized Tier 1 domain detection...")
+        if tier1 is None:
+            tier1 = self._embedding_tier1_detection(text)
+        tier1_domain, tier1_confidence = tier1
+        logger.info(f"Primary domain: {tier1_domain} (confidence: {tier1_confidence:.3f})")
         
         # Step 2: Get Tier 2 categories for the detected domain
-        print("Step 2: Retrieving Tier 2 categories...")
+        logger.debug("Step 2: Retrieving Tier 2 categories...")
         tier2_categories = self._get_tier2_categories_for_domain(tier1_domain)
-        print(f"Found {len(tier2_categories)} Tier 2 categories in {tier1_domain}")
+        logger.debug(f"Found {len(tier2_categories)} Tier 2 categories in {tier1_domain}")
         
         if not tier2_categories:
-            print("Warning: No Tier 2 categories found for this domain")
+            logger.warning(f"No Tier 2 categories found for {tier1_domain}")
             # Return minimal result
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             return FinalClassificationResult(
                 primary_tier1_domain=tier1_domain,
                 tier2_categories=[],
@@ -290,11 +501,11 @@ Response format (JSON):
             )
         
         # Step 3: LLM-based Tier 2 classification with user profiling
-        print("Step 3: LLM-based Tier 2 classification with user profiling...")
-        llm_result = self._llm_tier2_classification_with_profiling(text, tier1_domain, tier2_categories)
+        logger.debug("Step 3: LLM-based Tier 2 classification with user profiling...")
+        llm_result = self._cached_llm_tier2_classification(text, tier1_domain, tier2_categories)
         
         # Step 4: Build final result
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
           # Extract user profile
         profile_data = llm_result.get('user_profile', {})
         user_profile = UserProfile(
@@ -318,39 +529,62 @@ Response format (JSON):
             method_used="hybrid_embedding_llm"
         )
         
-        print(f"Classification completed in {processing_time:.3f} seconds")
+        logger.info(f"Classification completed in {processing_time:.3f} seconds")
         return result
     
-    def classify_batch(self, texts: List[str], text_names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    def classify_many(self, texts: List[str], max_workers: int = 8) -> List[FinalClassificationResult]:
+        """
+        Classify several texts concurrently, returning results in input order.
+        
+        Embeddings for all texts are requested up front in batched calls and
+        Tier 1 is detected for all of them with a single matmul; the Tier 2
+        LLM calls then run in a thread pool. Each result's processing_time
+        therefore covers only its own (concurrent) Tier 2 step; the batched
+        Tier 1 time is logged once at INFO.
+        """
+        if not texts:
+            return []
+        
+        tier1_results: List[Optional[Tuple[str, float]]] = [None] * len(texts)
+        if REAL_API_AVAILABLE and self.optimized_tier1_detector:
+            try:
+                start_time = time.perf_counter()
+                # Same truncation as OptimizedTier1Detector so cache keys match
+                embeddings = embed_texts_sync([text[:8000] for text in texts],
+                                              use_cache=self.use_cache)
+                tier1_results = self.optimized_tier1_detector.detect_tier1_domains(embeddings)
+                # Per-result processing_time then covers Tier 2 only
+                logger.info(f"Batched Tier 1 detection for {len(texts)} texts: "
+                            f"{time.perf_counter() - start_time:.3f} seconds")
+            except Exception as e:
+                logger.warning(f"Batched Tier 1 detection failed, detecting texts one by one: {e}")
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(texts))) as executor:
+            return list(executor.map(self._classify, texts, tier1_results))
+    
+    def classify_batch(self, texts: List[str], text_names: Optional[List[str]] = None,
+                       max_workers: int = 8) -> List[Dict[str, Any]]:
         """
         Classify multiple texts and return detailed results.
+        
+        Texts are classified concurrently (at most max_workers OpenAI requests
+        in flight) via classify_many; results keep the input order.
         """
         if text_names is None:
             text_names = [f"text_{i+1}" for i in range(len(texts))]
         
         results = []
+        classifications = self.classify_many(texts, max_workers=max_workers)
         
-        for i, text in enumerate(texts):
-            print(f"\n{'='*60}")
-            print(f"Classifying: {text_names[i]}")
-            print(f"{'='*60}")
-            
-            result = self.classify(text)
-            
+        for i, (text, result) in enumerate(zip(texts, classifications)):
             # Convert to dictionary for JSON serialization
             result_dict = {
                 "text_name": text_names[i],
                 "text_length": len(text),
                 "text_preview": text[:200] + "..." if len(text) > 200 else text,
                 "primary_tier1_domain": result.primary_tier1_domain,
-                "tier2_categories": result.tier2_categories,                "user_profile": {
-                    "age_range": result.user_profile.age_range,
-                    "gender": result.user_profile.gender,
-                    "geek_level": result.user_profile.geek_level,
-                    "media_quality": result.user_profile.media_quality,
-                    "likely_demographics": result.user_profile.likely_demographics,
-                    "confidence": result.user_profile.confidence
-                },
+                "tier2_categories": result.tier2_categories,
+                "user_profile": asdict(result.user_profile),
                 "processing_time": result.processing_time,
                 "method_used": result.method_used
             }
@@ -358,18 +592,20 @@ Response format (JSON):
             results.append(result_dict)
             
             # Brief summary
-            print(f"\nResults for {text_names[i]}:")
-            print(f"  Primary Domain: {result.primary_tier1_domain}")
-            print(f"  Tier 2 Categories: {len(result.tier2_categories)}")
+            logger.info(f"Results for {text_names[i]}:")
+            logger.info(f"  Primary Domain: {result.primary_tier1_domain}")
+            logger.info(f"  Tier 2 Categories: {len(result.tier2_categories)}")
             for j, cat in enumerate(result.tier2_categories, 1):
-                print(f"    {j}. {cat.get('name', 'Unknown')} (confidence: {cat.get('confidence', 0):.2f})")
-            print(f"  User Profile: {result.user_profile.age_range}, geek level: {result.user_profile.geek_level}/10")
-            print(f"  Processing Time: {result.processing_time:.3f}s")
+                logger.info(f"    {j}. {cat.get('name', 'Unknown')} (confidence: {cat.get('confidence', 0):.2f})")
+            logger.info(f"  User Profile: {result.user_profile.age_range}, geek level: {result.user_profile.geek_level}/10")
+            logger.info(f"  Processing Time: {result.processing_time:.3f}s")
         
         return results
 
 def main():
     """Demonstration of the finalized hybrid classifier."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("FINALIZED HYBRID IAB CLASSIFIER DEMONSTRATION")
     print("=" * 60)
     
@@ -435,8 +671,8 @@ def main():
         "results": results
     }
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(final_output, f, indent=2, ensure_ascii=False)
+    with open(output_path, 'wb') as f:
+        f.write(dumps_pretty(final_output))
     
     print(f"\n{'='*60}")
     print("FINAL SUMMARY")
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryResult:
     """Represents a classified IAB category with confidence score."""
     id: str
@@ -16,7 +16,7 @@ class CategoryResult:
     tier_4: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PersonaResult:
     """Represents a target reader persona inference."""
     age_band: str  # "18-24", "25-34", "35-49", "50+"
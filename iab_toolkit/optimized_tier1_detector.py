@@ -8,15 +8,19 @@ Key optimizations:
 3. Uses taxonomy structure to build comprehensive domain descriptions
 """
 
+import functools
 import json
+import logging
 import numpy as np
 import time
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 try:
     from ._gpt import _load_taxonomy
-    from ._embedding import embed_text_sync, normalize_vector, cosine_similarity
+    from ._embedding import embed_text_sync, embed_texts_sync, normalize_vector
     from ._config import config
     REAL_API_AVAILABLE = True
 except ImportError:
@@ -45,7 +49,7 @@ class OptimizedTier1Detector:
         These descriptions are already optimized with child categories included.
         """
         if not self.tier1_taxonomy_file.exists():
-            print(f"Error: {self.tier1_taxonomy_file} not found")
+            logger.error(f"{self.tier1_taxonomy_file} not found")
             return {}
         
         with open(self.tier1_taxonomy_file, 'r', encoding='utf-8') as f:
@@ -62,30 +66,22 @@ class OptimizedTier1Detector:
     def _create_tier1_embeddings(self):
         """Create and save optimized Tier 1 embeddings."""
         if not REAL_API_AVAILABLE:
-            print("API not available - cannot create embeddings")
+            logger.error("API not available - cannot create embeddings")
             return
         
-        print("Creating optimized Tier 1 embeddings...")
+        logger.info("Creating optimized Tier 1 embeddings...")
         descriptions = self._get_tier1_domain_descriptions()
         
         domains = list(descriptions.keys())
-        embeddings = []
         
-        print(f"Processing {len(domains)} Tier 1 domains...")
-        for i, domain in enumerate(domains):
-            description = descriptions[domain]
-            print(f"  {i+1}/{len(domains)}: {domain}")
-            print(f"    Description: {description[:100]}...")
-            
-            # Create embedding for rich description
-            embedding = embed_text_sync(description)
-            embedding = normalize_vector(embedding)
-            embeddings.append(embedding)
-            
-            time.sleep(0.1)  # Rate limiting
+        # All descriptions go out in one batched embeddings request; rows come
+        # back normalized and in domain order
+        logger.info(f"Embedding descriptions of {len(domains)} Tier 1 domains in one batch...")
+        embeddings_array = embed_texts_sync([descriptions[domain] for domain in domains])
+        # Stored as C-contiguous float32 so the loader can memory-map it directly
+        embeddings_array = np.ascontiguousarray(embeddings_array, dtype=np.float32)
         
         # Save embeddings and domain order
-        embeddings_array = np.array(embeddings)
         
         # Ensure data directory exists
         self.embeddings_file.parent.mkdir(parents=True, exist_ok=True)
@@ -95,8 +91,8 @@ class OptimizedTier1Detector:
         with open(self.domains_file, 'w') as f:
             json.dump(domains, f, indent=2)
         
-        print(f"Saved embeddings: {self.embeddings_file}")
-        print(f"Saved domains: {self.domains_file}")
+        logger.info(f"Saved embeddings: {self.embeddings_file}")
+        logger.info(f"Saved domains: {self.domains_file}")
         
         self.tier1_embeddings = embeddings_array
         self.tier1_domains = domains
@@ -104,18 +100,20 @@ class OptimizedTier1Detector:
     def _load_or_create_embeddings(self):
         """Load existing embeddings or create new ones."""
         if (self.embeddings_file.exists() and self.domains_file.exists()):
-            print("Loading precomputed Tier 1 embeddings...")
-            self.tier1_embeddings = np.load(self.embeddings_file)
+            logger.info("Loading precomputed Tier 1 embeddings...")
+            # The shipped matrix is already unit-normalized float32, so it can be
+            # memory-mapped as-is and its pages shared between worker processes
+            self.tier1_embeddings = np.load(self.embeddings_file, mmap_mode='r')
             
             with open(self.domains_file, 'r') as f:
                 self.tier1_domains = json.load(f)
             
-            print(f"Loaded {len(self.tier1_domains)} domain embeddings")
+            logger.info(f"Loaded {len(self.tier1_domains)} domain embeddings")
         else:
-            print("No precomputed embeddings found - creating new ones...")
+            logger.info("No precomputed embeddings found - creating new ones...")
             self._create_tier1_embeddings()
     
-    def detect_tier1_domain(self, text: str) -> Tuple[str, float]:
+    def detect_tier1_domain(self, text: str, use_cache: bool = True) -> Tuple[str, float]:
         """
         Fast Tier 1 detection using precomputed embeddings.
         
@@ -124,36 +122,57 @@ class OptimizedTier1Detector:
         - Optimized: 1 API call per classification
         
         Pure embedding-based approach - no keyword fallbacks.
+        With use_cache=False the text is always embedded by the API.
         """
         if not REAL_API_AVAILABLE:
             return "Unknown", 0.0
             
         if self.tier1_embeddings is None:
-            print("Error: No precomputed embeddings available")
+            logger.error("No precomputed embeddings available")
             return "Unknown", 0.0
         
         try:
             # Single embedding call for input text
-            text_embedding = embed_text_sync(text[:8000])
+            text_embedding = embed_text_sync(text[:8000], use_cache=use_cache)
             text_embedding = normalize_vector(text_embedding)
             
-            # Fast cosine similarity with all precomputed embeddings
-            similarities = []
-            for i, domain_embedding in enumerate(self.tier1_embeddings):
-                similarity = cosine_similarity(text_embedding, domain_embedding)
-                similarities.append((self.tier1_domains[i], similarity))
-            
-            # Get best match
-            best_domain, best_score = max(similarities, key=lambda x: x[1])
-            
             # Return the best match regardless of confidence
             # Let the caller decide what to do with low confidence scores
-            return best_domain, best_score
+            return self.detect_tier1_domains(text_embedding[None, :])[0]
             
         except Exception as e:
-            print(f"Error in optimized Tier 1 detection: {e}")
+            logger.error(f"Error in optimized Tier 1 detection: {e}")
             return "Unknown", 0.0
     
+    def detect_tier1_domains(self, embeddings: np.ndarray) -> List[Tuple[str, float]]:
+        """
+        Tier 1 detection for already embedded texts.
+        
+        Args:
+            embeddings: (M, D) matrix of normalized text embeddings
+            
+        Returns:
+            (best_domain, best_score) for each row, computed with one matmul
+        """
+        similarities = embeddings @ self.tier1_embeddings.T
+        best = similarities.argmax(axis=1)
+        scores = similarities[np.arange(len(best)), best]
+        return [(self.tier1_domains[i], float(score)) for i, score in zip(best, scores)]
+    
+    def embed_text(self, text: str, use_cache: bool = True) -> Optional[np.ndarray]:
+        """
+        Embed text the same way detect_tier1_domain does.
+        Returns None when the embedding API is unavailable.
+        """
+        if not REAL_API_AVAILABLE:
+            return None
+        
+        try:
+            return normalize_vector(embed_text_sync(text[:8000], use_cache=use_cache))
+        except Exception as e:
+            logger.error(f"Error embedding text: {e}")
+            return None
+    
     def detect_tier1_domain_with_top_matches(self, text: str, top_n: int = 5) -> Tuple[str, float, List[Tuple[str, float]]]:
         """
         Fast Tier 1 detection with top N matches for debugging.
@@ -163,7 +182,7 @@ class OptimizedTier1Detector:
             return "Unknown", 0.0, []
             
         if self.tier1_embeddings is None:
-            print("Error: No precomputed embeddings available")
+            logger.error("No precomputed embeddings available")
             return "Unknown", 0.0, []
         
         try:
@@ -172,28 +191,39 @@ class OptimizedTier1Detector:
             text_embedding = normalize_vector(text_embedding)
             
             # Fast cosine similarity with all precomputed embeddings
-            similarities = []
-            for i, domain_embedding in enumerate(self.tier1_embeddings):
-                similarity = cosine_similarity(text_embedding, domain_embedding)
-                similarities.append((self.tier1_domains[i], similarity))
+            similarities = text_embedding @ self.tier1_embeddings.T
             
             # Sort by similarity (highest first)
-            similarities.sort(key=lambda x: x[1], reverse=True)
+            order = np.argsort(-similarities)[:top_n]
+            top_matches = [(self.tier1_domains[i], float(similarities[i])) for i in order]
             
             # Get best match and top N
-            best_domain, best_score = similarities[0]
-            top_matches = similarities[:top_n]
+            best_domain, best_score = top_matches[0]
             
             return best_domain, best_score, top_matches
             
         except Exception as e:
-            print(f"Error in optimized Tier 1 detection: {e}")
+            logger.error(f"Error in optimized Tier 1 detection: {e}")
             return "Unknown", 0.0, []
 
 
+@functools.cache
+def get_detector() -> OptimizedTier1Detector:
+    """
+    Return the shared OptimizedTier1Detector, loading it on first access.
+    
+    The similarity kernel is exercised once here so the first real
+    classification does not pay BLAS warm-up costs.
+    """
+    detector = OptimizedTier1Detector()
+    if detector.tier1_embeddings is not None and len(detector.tier1_embeddings):
+        detector.detect_tier1_domains(detector.tier1_embeddings[:1])
+    return detector
+
+
 def test_optimization():
     """Test the optimized approach with pure embedding-based detection."""
-    detector = OptimizedTier1Detector()
+    detector = get_detector()
     
     # Test texts
     test_texts = [
@@ -215,9 +245,9 @@ def test_optimization():
     for i, text in enumerate(test_texts, 1):
         print(f"\nTest {i}: {text[:60]}...")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         domain, confidence = detector.detect_tier1_domain(text)
-        detection_time = time.time() - start_time
+        detection_time = time.perf_counter() - start_time
         total_time += detection_time
         
         print(f"  Result: {domain}")
@@ -236,7 +266,7 @@ def test_optimization():
 
 if __name__ == "__main__":
     test_optimization()
-    detector = OptimizedTier1Detector()
+    detector = get_detector()
     
     # Test texts
     test_texts = [
@@ -253,9 +283,9 @@ if __name__ == "__main__":
     for i, text in enumerate(test_texts, 1):
         print(f"\nTest {i}: {text[:60]}...")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         domain, confidence = detector.detect_tier1_domain(text)
-        detection_time = time.time() - start_time
+        detection_time = time.perf_counter() - start_time
         
         print(f"Result: {domain} (confidence: {confidence:.3f})")
         print(f"Time: {detection_time:.3f} seconds")
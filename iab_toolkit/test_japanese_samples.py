@@ -5,77 +5,57 @@ the hybrid classification system with .npy embeddings.
 Output is redirected to a log file.
 """
 
+import logging
 import time
 from pathlib import Path
 import sys # Added for stdout redirection
 from datetime import datetime # Added for timestamped log file
 from .hybrid_iab_classifier import HybridIABClassifier
 
+# (filename, display name, expected Tier 1 domain, description)
+SAMPLE_FILES = (
+    ("japanese_text_sample.txt", "Automotive", "Automotive", "トヨタRAV4 SUV"),
+    ("japanese_beauty_sample.txt", "Beauty & Cosmetics", "Style & Fashion", "オーガニック化粧品ブランド"),
+    ("japanese_technology_sample.txt", "Technology", "Technology & Computing", "iPhone 15 Pro技術"),
+    ("japanese_business_sample.txt", "Business & Finance", "Business and Finance", "東京証券取引所企業"),
+    ("japanese_health_sample.txt", "Health & Wellness", "Healthy Living", "東京大学医学部研究"),
+    ("japanese_careers_sample.txt", "Careers & Employment", "Careers", "キャリアアップセミナー情報"),
+    ("japanese_education_sample.txt", "Education", "Education", "オンライン学習プラットフォーム"),
+    ("japanese_food_drink_sample.txt", "Food & Drink", "Food & Drink", "東京レストラン春の特別コース"),
+)
+
 def load_japanese_samples():
     """Load all Japanese sample files."""
     base_path = Path(__file__).parent / "data"
     
     samples = {}
-    sample_files = {
-        "japanese_text_sample.txt": {
-            "name": "Automotive",
-            "expected_tier1": "Automotive", 
-            "description": "トヨタRAV4 SUV"
-        },
-        "japanese_beauty_sample.txt": {
-            "name": "Beauty & Cosmetics",
-            "expected_tier1": "Style & Fashion",
-            "description": "オーガニック化粧品ブランド"
-        },
-        "japanese_technology_sample.txt": {
-            "name": "Technology",
-            "expected_tier1": "Technology & Computing",
-            "description": "iPhone 15 Pro技術"
-        },
-        "japanese_business_sample.txt": {
-            "name": "Business & Finance",
-            "expected_tier1": "Business and Finance",
-            "description": "東京証券取引所企業"
-        },
-        "japanese_health_sample.txt": {
-            "name": "Health & Wellness",
-            "expected_tier1": "Healthy Living",
-            "description": "東京大学医学部研究"
-        },          "japanese_careers_sample.txt": {
-            "name": "Careers & Employment",
-            "expected_tier1": "Careers",
-            "description": "キャリアアップセミナー情報"
-        },
-        "japanese_education_sample.txt": {
-            "name": "Education",
-            "expected_tier1": "Education",
-            "description": "オンライン学習プラットフォーム"
-        },
-        "japanese_food_drink_sample.txt": {
-            "name": "Food & Drink",
-            "expected_tier1": "Food & Drink",
-            "description": "東京レストラン春の特別コース"
-        }
-    }
     
-    for filename, info in sample_files.items():
+    for filename, name, expected_tier1, description in SAMPLE_FILES:
         file_path = base_path / filename
-        if file_path.exists():
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read().strip()
-                samples[filename] = {
-                    "text": text,
-                    "name": info["name"],
-                    "expected_tier1": info["expected_tier1"],
-                    "description": info["description"]
-                }
+        try:
+            # One binary read plus a single decode; avoids a separate exists() stat
+            text = file_path.read_bytes().decode('utf-8').strip()
+        except FileNotFoundError:
+            text = None
+        if text is not None:
+            samples[filename] = {
+                "text": text,
+                "name": name,
+                "expected_tier1": expected_tier1,
+                "description": description
+            }
         else:
             print(f"⚠️  Warning: Sample file not found: {filename}")
     
     return samples
 
-def test_japanese_classification():
-    """Test the hybrid classifier with all Japanese samples. Output to log file."""
+def test_japanese_classification(use_cache: bool = False):
+    """
+    Test the hybrid classifier with all Japanese samples. Output to log file.
+    
+    Cached results are skipped by default so the reported processing times
+    reflect real API calls.
+    """
     
     original_stdout = sys.stdout
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -90,6 +70,15 @@ def test_japanese_classification():
     
     log_file = open(log_file_path, 'w', encoding='utf-8')
     sys.stdout = log_file
+    # Classifier progress goes through logging; send it only to the same log
+    # file (not on to the console handlers of the root logger)
+    package_logger = logging.getLogger("iab_toolkit")
+    saved_level, saved_propagate = package_logger.level, package_logger.propagate
+    log_handler = logging.StreamHandler(log_file)
+    log_handler.setFormatter(logging.Formatter("%(message)s"))
+    package_logger.addHandler(log_handler)
+    package_logger.setLevel(logging.INFO)
+    package_logger.propagate = False
     
     try:
         print("=" * 80)
@@ -102,7 +91,7 @@ def test_japanese_classification():
         
         # Initialize classifier
         print("Initializing HybridIABClassifier...")
-        classifier = HybridIABClassifier()
+        classifier = HybridIABClassifier(use_cache=use_cache)
         print()
         
         # Load Japanese samples
@@ -115,11 +104,19 @@ def test_japanese_classification():
         print(f"📄 Loaded {len(samples)} Japanese sample files")
         print()
         
+        # Classify all samples concurrently, then report them in order
+        start_ns = time.perf_counter_ns()
+        classifications = classifier.classify_many([sample["text"] for sample in samples.values()])
+        batch_ns = time.perf_counter_ns() - start_ns
+        print(f"⏱️  全サンプル分類時間: {batch_ns / 1e9:.3f}秒")
+        print("   (Tier 1 の埋め込みは全サンプル一括で実行。サンプル別の処理時間は並列実行された Tier 2 のみ)")
+        print()
+        
         # Test each sample
         results = []
         total_time = 0
         
-        for i, (filename, sample) in enumerate(samples.items(), 1):
+        for i, ((filename, sample), result) in enumerate(zip(samples.items(), classifications), 1):
             text = sample["text"]
             name = sample["name"]
             expected = sample["expected_tier1"]
@@ -133,10 +130,7 @@ def test_japanese_classification():
             print(f"📖 テキスト概要: {text[:100]}...")
             print()
             
-            # Perform classification
-            start_time = time.time()
-            result = classifier.classify(text)
-            classification_time = time.time() - start_time
+            classification_time = result.processing_time
             total_time += classification_time
             
             # Check tier1 accuracy
@@ -172,7 +166,7 @@ def test_japanese_classification():
             print()
             
             # Performance
-            print(f"⏱️  処理時間: {classification_time:.3f}秒")
+            print(f"⏱️  処理時間 (Tier 2のみ): {classification_time:.3f}秒")
             print()
             
             # Store results
@@ -224,14 +218,17 @@ def test_japanese_classification():
         return results # Still return results if needed elsewhere, though summary is gone
     
     finally:
+        package_logger.removeHandler(log_handler)
+        package_logger.setLevel(saved_level)
+        package_logger.propagate = saved_propagate
         sys.stdout = original_stdout # Restore stdout
         log_file.close()
         # Print to console after redirection is restored
         print(f"Test output saved to: {log_file_path}")
 
-def main():
+def main(use_cache: bool = False):
     """Main entry point for the CLI command."""
-    test_japanese_classification()
+    test_japanese_classification(use_cache=use_cache)
 
 if __name__ == "__main__":
     main()
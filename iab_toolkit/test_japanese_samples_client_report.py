@@ -9,66 +9,45 @@ from pathlib import Path
 from datetime import datetime
 from .hybrid_iab_classifier import HybridIABClassifier
 import sys # Added for stdout redirection
-import io # Added for suppressing verbose output
+
+# (filename, display name, description)
+SAMPLE_FILES = (
+    ("japanese_text_sample.txt", "Given Automotive", "トヨタRAV4 SUV"),
+    ("japanese_beauty_sample.txt", "Beauty & Cosmetics", "オーガニック化粧品ブランド"),
+    ("japanese_technology_sample.txt", "Technology", "iPhone 15 Pro技術"),
+    ("japanese_business_sample.txt", "Business & Finance", "東京証券取引所企業"),
+    ("japanese_health_sample.txt", "Health & Wellness", "東京大学医学部研究"),
+    ("japanese_careers_sample.txt", "Careers & Employment", "キャリアアップセミナー情報"),
+    ("japanese_education_sample.txt", "Education & Learning", "オンライン学習プラットフォーム"),
+    ("japanese_food_drink_sample.txt", "Food & Drink", "東京レストラン春の特別コース"),
+)
 
 def load_japanese_samples():
     """Load all Japanese sample files."""
     base_path = Path(__file__).parent / "data"
     
     samples = {}
-    sample_files = {
-        "japanese_text_sample.txt": {
-            "name": "Given Automotive",
-            "description": "トヨタRAV4 SUV"
-        },
-        "japanese_beauty_sample.txt": {
-            "name": "Beauty & Cosmetics",
-            "description": "オーガニック化粧品ブランド"
-            # Expected tier1 removed as it's not for client report
-        },
-        "japanese_technology_sample.txt": {
-            "name": "Technology",
-            "description": "iPhone 15 Pro技術"
-        },
-        "japanese_business_sample.txt": {
-            "name": "Business & Finance",
-            "description": "東京証券取引所企業"
-        },
-        "japanese_health_sample.txt": {
-            "name": "Health & Wellness",
-            "description": "東京大学医学部研究"
-        },
-        "japanese_careers_sample.txt": {
-            "name": "Careers & Employment",
-            "description": "キャリアアップセミナー情報"
-        },
-        "japanese_education_sample.txt": {
-            "name": "Education & Learning",
-            "description": "オンライン学習プラットフォーム"
-        },
-        "japanese_food_drink_sample.txt": {
-            "name": "Food & Drink",
-            "description": "東京レストラン春の特別コース"
-        }
-    }
     
-    for filename, info in sample_files.items():
+    for filename, name, description in SAMPLE_FILES:
         file_path = base_path / filename
-        if file_path.exists():
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read().strip()
-                samples[filename] = {
-                    "text": text,
-                    "name": info["name"],
-                    "description": info["description"]
-                }
+        try:
+            # One binary read plus a single decode; avoids a separate exists() stat
+            text = file_path.read_bytes().decode('utf-8').strip()
+        except FileNotFoundError:
+            text = None
+        if text is not None:
+            samples[filename] = {
+                "text": text,
+                "name": name,
+                "description": description
+            }
         else:
             # Simplified warning for client script, or could be removed if files are guaranteed
             print(f"Warning: Sample file not found: {filename}")
     
     return samples
 
-def generate_client_report():
+def generate_client_report(use_cache: bool = True):
     """Generates and prints the client report for Japanese samples."""
     
     original_stdout = sys.stdout
@@ -94,14 +73,9 @@ def generate_client_report():
             # Initialize classifier
             print("Initializing Classifier...")
             
-            # Suppress stdout for classifier initialization's verbose messages
-            current_stdout_for_init = sys.stdout
-            temp_stdout_for_init = io.StringIO()
-            sys.stdout = temp_stdout_for_init
-            try:
-                classifier = HybridIABClassifier()
-            finally:
-                sys.stdout = current_stdout_for_init # Restore stdout to the report file
+            # The classifier reports progress through logging, not stdout,
+            # so none of it ends up in the report
+            classifier = HybridIABClassifier(use_cache=use_cache)
             
             print("Classifier Initialized.")
             print()
@@ -130,14 +104,8 @@ def generate_client_report():
                 print(text)
                 print("--- サンプル終了 ---\\n")
                 
-                # Perform classification - suppress verbose output from classify()
-                saved_stdout_loop = sys.stdout
-                temp_stdout_loop = io.StringIO()
-                sys.stdout = temp_stdout_loop
-                try:
-                    result = classifier.classify(text)
-                finally:
-                    sys.stdout = saved_stdout_loop # Restore stdout
+                # Perform classification
+                result = classifier.classify(text)
                 
                 # Show tier2 categories
                 if result.tier2_categories:
@@ -175,9 +143,9 @@ def generate_client_report():
     # Print to console after generation
     print(f"Client report successfully saved to: {report_file_path}")
 
-def main():
+def main(use_cache: bool = True):
     """Main entry point for the client report generation."""
-    generate_client_report()
+    generate_client_report(use_cache=use_cache)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,143 @@
+"""Offline tests for the persistent and semantic caches."""
+
+import sqlite3
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from iab_toolkit import _cache
+from iab_toolkit._cache import DiskCache, SemanticCache, content_key
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.time() inside the cache module."""
+    now = [1_000_000.0]
+    monkeypatch.setattr(_cache, "time", SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+def unit(*values):
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def test_content_key_is_stable_and_separates_parts():
+    assert content_key("model", "text") == content_key("model", "text")
+    assert content_key("model", "text") != content_key("model", "text2")
+    assert content_key("ab", "c") != content_key("a", "bc")
+
+
+def test_disk_cache_get_put(tmp_path):
+    cache = DiskCache("test", directory=tmp_path)
+    assert cache.get("missing") is None
+
+    cache.put("key", b"value")
+    assert cache.get("key") == b"value"
+    cache.put("key", b"replaced")
+    assert cache.get("key") == b"replaced"
+    assert (tmp_path / "test.sqlite").exists()
+
+
+def test_disk_cache_persists_across_instances(tmp_path):
+    DiskCache("test", directory=tmp_path).put("key", b"value")
+    assert DiskCache("test", directory=tmp_path).get("key") == b"value"
+
+
+def test_disk_cache_memory_lru_is_bounded(tmp_path):
+    cache = DiskCache("test", directory=tmp_path, memory_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, key.encode())
+    assert list(cache._memory) == ["b", "c"]
+    # Evicted entries are still served from disk
+    assert cache.get("a") == b"a"
+    assert list(cache._memory) == ["c", "a"]
+
+
+def test_disk_cache_ttl_expiry(tmp_path, clock):
+    cache = DiskCache("test", directory=tmp_path, ttl_seconds=60)
+    cache.put("key", b"value")
+
+    clock[0] += 59
+    assert cache.get("key") == b"value"
+    assert DiskCache("test", directory=tmp_path, ttl_seconds=60).get("key") == b"value"
+
+    clock[0] += 2
+    assert cache.get("key") is None
+    assert "key" not in cache._memory
+    assert DiskCache("test", directory=tmp_path, ttl_seconds=60).get("key") is None
+    # Without a TTL the same row never expires
+    assert DiskCache("test", directory=tmp_path).get("key") == b"value"
+
+
+def test_disk_cache_migrates_legacy_table(tmp_path, clock):
+    path = tmp_path / "legacy.sqlite"
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE cache (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+        conn.execute("INSERT INTO cache VALUES ('old', x'01')")
+    conn.close()
+
+    assert DiskCache("legacy", directory=tmp_path).get("old") == b"\x01"
+    # Rows from before TTL support count as arbitrarily old
+    assert DiskCache("legacy", directory=tmp_path, ttl_seconds=60).get("old") is None
+
+    cache = DiskCache("legacy", directory=tmp_path, ttl_seconds=60)
+    cache.put("new", b"\x02")
+    assert DiskCache("legacy", directory=tmp_path, ttl_seconds=60).get("new") == b"\x02"
+
+
+def test_disk_cache_disables_itself_on_errors(tmp_path):
+    # A directory where the database file should be cannot be opened
+    (tmp_path / "broken.sqlite").mkdir()
+    cache = DiskCache("broken", directory=tmp_path)
+    cache.put("key", b"value")
+    assert cache._disabled
+    # The in-process tier keeps working
+    assert cache.get("key") == b"value"
+    assert DiskCache("broken", directory=tmp_path).get("other") is None
+
+
+def test_disk_cache_disables_itself_when_directory_cannot_be_created(tmp_path):
+    blocker = tmp_path / "not_a_directory"
+    blocker.write_text("")
+    cache = DiskCache("test", directory=blocker / "cache")
+    assert cache.get("key") is None
+    assert cache._disabled
+
+
+def test_semantic_cache_threshold():
+    cache = SemanticCache(threshold=0.95)
+    assert cache.get(unit(1, 0, 0)) is None
+
+    cache.put(unit(1, 0, 0), "value")
+    assert cache.get(unit(1, 0, 0)) == "value"
+    assert cache.get(unit(1, 0.2, 0)) == "value"  # cosine ~0.98
+    assert cache.get(unit(1, 0.5, 0)) is None  # cosine ~0.89
+
+
+def test_semantic_cache_scope():
+    cache = SemanticCache(threshold=0.95)
+    cache.put(unit(1, 0, 0), "auto", scope="Automotive")
+    cache.put(unit(1, 0.01, 0), "tech", scope="Technology")
+    assert cache.get(unit(1, 0, 0), scope="Automotive") == "auto"
+    assert cache.get(unit(1, 0, 0), scope="Technology") == "tech"
+    assert cache.get(unit(1, 0, 0), scope="Health") is None
+
+
+def test_semantic_cache_returns_closest_match():
+    cache = SemanticCache(threshold=0.9)
+    cache.put(unit(1, 0.3, 0), "farther")
+    cache.put(unit(1, 0.05, 0), "closer")
+    assert cache.get(unit(1, 0, 0)) == "closer"
+
+
+def test_semantic_cache_evicts_oldest_entries():
+    cache = SemanticCache(threshold=0.99, max_entries=2)
+    cache.put(unit(1, 0, 0), "x")
+    cache.put(unit(0, 1, 0), "y")
+    cache.put(unit(0, 0, 1), "z")
+    assert cache.get(unit(1, 0, 0)) is None
+    assert cache.get(unit(0, 1, 0)) == "y"
+    assert cache.get(unit(0, 0, 1)) == "z"
+    assert len(cache._values) == 2
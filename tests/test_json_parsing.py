@@ -0,0 +1,114 @@
+"""Tests for parsing streamed and cleaned-up Tier 2 JSON answers."""
+
+import json
+from types import SimpleNamespace
+
+from iab_toolkit._gpt import _clean_json_response
+from iab_toolkit.hybrid_iab_classifier import _read_json_object
+
+ANSWER = json.dumps({
+    "tier2_categories": [{"id": "2", "name": "SUV", "confidence": 0.9}],
+    "user_profile": {"age_range": "30-45", "geek_level": 7},
+})
+
+
+def chunk(content):
+    """A streamed chunk carrying one content delta (None for no content)."""
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+class FakeStream:
+    """Minimal stand-in for an OpenAI chat completion stream."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self):
+        for item in self.chunks:
+            self.consumed += 1
+            yield item
+
+    def close(self):
+        self.closed = True
+
+
+def stream_of(*deltas):
+    return FakeStream([chunk(delta) for delta in deltas])
+
+
+def split_every(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_read_json_object_joins_split_chunks():
+    for size in (1, 3, 7, len(ANSWER)):
+        stream = stream_of(*split_every(ANSWER, size))
+        assert json.loads(_read_json_object(stream)) == json.loads(ANSWER)
+        assert stream.closed
+
+
+def test_read_json_object_stops_at_closing_brace():
+    stream = stream_of(ANSWER[:10], ANSWER[10:] + "\n\n", "  ", "more")
+    assert _read_json_object(stream) == ANSWER
+    assert stream.consumed == 2
+    assert stream.closed
+
+
+def test_read_json_object_ignores_braces_and_escaped_quotes_in_strings():
+    answer = '{"reason": "uses {braces}, [brackets] and \\"quotes}\\"", "n": [1, {"a": "\\\\"}]}'
+    stream = stream_of(*split_every(answer, 4), "trailing")
+    content = _read_json_object(stream)
+    assert content == answer
+    assert json.loads(content)["reason"] == 'uses {braces}, [brackets] and "quotes}"'
+
+
+def test_read_json_object_skips_leading_text():
+    stream = stream_of('Here is the ["json"] answer: ', '```json\n', ANSWER, '\n```')
+    content = _read_json_object(stream)
+    assert content == 'Here is the ["json"] answer: ```json\n' + ANSWER
+    assert json.loads(_clean_json_response(content)) == json.loads(ANSWER)
+
+
+def test_read_json_object_skips_empty_chunks():
+    stream = FakeStream([SimpleNamespace(choices=[]), chunk(None), chunk(""), chunk(ANSWER)])
+    assert _read_json_object(stream) == ANSWER
+
+
+def test_read_json_object_returns_everything_without_an_object():
+    stream = stream_of("no json ", "here")
+    assert _read_json_object(stream) == "no json here"
+    assert stream.closed
+
+
+def test_clean_json_response_returns_bare_json_unchanged():
+    assert _clean_json_response(ANSWER) == ANSWER
+    assert _clean_json_response("  \n" + ANSWER) == ANSWER
+    assert _clean_json_response("[1, 2]") == "[1, 2]"
+
+
+def test_clean_json_response_strips_code_fences():
+    assert _clean_json_response("```json\n" + ANSWER + "\n```") == ANSWER
+    assert _clean_json_response("```\n" + ANSWER + "\n```\n") == ANSWER
+
+
+def test_clean_json_response_strips_surrounding_prose():
+    text = "Sure! Here is the classification:\n" + ANSWER + "\nLet me know if you need more."
+    assert _clean_json_response(text) == ANSWER
+
+
+def test_clean_json_response_handles_arrays():
+    assert _clean_json_response("Result: [1, 2] done") == "[1, 2]"
+    assert _clean_json_response('Result: [{"a":1}]') == '[{"a":1}]'
+    assert _clean_json_response('```json\n[{"a":1},{"b":2}]\n```') == '[{"a":1},{"b":2}]'
+
+
+def test_clean_json_response_skips_bracketed_prose():
+    assert _clean_json_response('[Note] {"a":1}') == '{"a":1}'
+    assert _clean_json_response('Here is the [json] answer: ```json\n' + ANSWER + '\n```') == ANSWER
+
+
+def test_clean_json_response_leaves_text_without_json():
+    assert _clean_json_response("no json here") == "no json here"
+    assert _clean_json_response("closing } before { opening") == "closing } before { opening"